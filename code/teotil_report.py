@@ -1,16 +1,33 @@
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from itertools import repeat
 
+import matplotlib
 import matplotlib.pyplot as plt
 import pandas as pd
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 from docx.oxml.xmlchemy import OxmlElement
 from docx.shared import Cm, Pt
 from docx.text.paragraph import Paragraph
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+# Plots are only ever saved to file, so use the non-interactive 'Agg' backend.
+# This also makes rendering safe in the worker processes used by 'make_plots'
+matplotlib.use("Agg")
 plt.style.use("ggplot")
 
+# One pre-sized figure reused for every plot, drawn straight to PNG via the
+# object-oriented Agg API. This avoids both the pyplot state machine and the
+# cost of building a new figure per heading
+_fig = Figure(figsize=(8, 6))
+_canvas = FigureCanvasAgg(_fig)
+
 
 def insert_para_after(para, style="Normal", align="center"):
     """Insert a new paragraph after the given paragraph.
@@ -23,22 +40,30 @@ def insert_para_after(para, style="Normal", align="center"):
     Returns:
         Paragraph object.
     """
+    if align not in ("left", "center", "right"):
+        raise ValueError("'align' must be one of 'left', 'center' or 'right'.")
+
+    # Build the '<w:p>' XML directly instead of assigning the Paragraph
+    # style/alignment properties, which re-resolve the property tree on
+    # every call
     new_p = OxmlElement("w:p")
-    para._p.addnext(new_p)
-    new_para = Paragraph(new_p, para._parent)
+    pPr = OxmlElement("w:pPr")
+    new_p.append(pPr)
 
-    new_para.style = style
+    # A paragraph without '<w:pStyle>' uses the default ('Normal') style
+    style_id = para.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+    if style_id is not None:
+        pStyle = OxmlElement("w:pStyle")
+        pStyle.set(qn("w:val"), style_id)
+        pPr.append(pStyle)
 
-    if align == "center":
-        new_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    elif align == "left":
-        new_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    elif align == "right":
-        new_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    else:
-        raise ValueError("'align' must be one of 'left', 'center' or 'right'.")
+    jc = OxmlElement("w:jc")
+    jc.set(qn("w:val"), align)
+    pPr.append(jc)
 
-    return new_para
+    para._p.addnext(new_p)
+
+    return Paragraph(new_p, para._parent)
 
 
 def insert_image(para, img_path, width_cm=15):
@@ -80,7 +105,8 @@ def insert_table(doc, para, df, table_style="Grid Table 4 Accent 1"):
     Returns:
         None.
     """
-    df = df.copy().astype(str)
+    # astype already returns a new frame, so the caller's df is not modified
+    df = df.astype(str)
     df.replace("<NA>", "", inplace=True)
 
     # Tables can only be added at the end of the document, but they can be moved
@@ -89,16 +115,38 @@ def insert_table(doc, para, df, table_style="Grid Table 4 Accent 1"):
     table = doc.add_table(df.shape[0] + 1, df.shape[1])
     table.style = table_style
 
-    # Add header
-    for j in range(df.shape[-1]):
-        table.cell(0, j).text = df.columns[j]
-        table.cell(0, j).paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+    # Each call to table.cell() walks the whole underlying XML grid, which is
+    # very slow for big tables, so fetch the full list of cells just once. See
+    # https://github.com/python-openxml/python-docx/issues/174
+    cells = table._cells
+    ncols = df.shape[1]
 
-    # Add data
-    for i in range(df.shape[0]):
-        for j in range(df.shape[-1]):
-            table.cell(i + 1, j).text = str(df.values[i, j])
-            table.cell(i + 1, j).paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    # Convert everything to plain strings up-front, rather than boxing each
+    # value through str() in the cell loop below
+    header = df.columns.tolist()
+
+    # Build the '<w:jc>' alignment elements once and copy them straight into
+    # each cell's paragraph XML. Assigning Paragraph.alignment per cell goes
+    # through python-docx's property machinery every time, which is slow
+    jc_center = OxmlElement("w:jc")
+    jc_center.set(qn("w:val"), "center")
+    jc_right = OxmlElement("w:jc")
+    jc_right.set(qn("w:val"), "right")
+
+    # Add header
+    for j, value in enumerate(header):
+        cells[j].text = value
+        p = cells[j]._tc.find(qn("w:p"))
+        p.get_or_add_pPr().append(deepcopy(jc_center))
+
+    # Add data. itertuples yields each row as a plain tuple without first
+    # materialising the whole frame as a numpy array (the df.values route)
+    for i, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        base = i * ncols
+        for j, value in enumerate(row):
+            cells[base + j].text = value
+            p = cells[base + j]._tc.find(qn("w:p"))
+            p.get_or_add_pPr().append(deepcopy(jc_right))
 
     # Move to desired location (paragraph)
     tbl, p = table._tbl, para._p
@@ -116,8 +164,6 @@ def make_plot(df, title, base_path, year):
     Returns:
         Plot path. Plot is saved to ./plots/
     """
-    df = df.copy()
-
     if base_path[-5] == "p":
         ylabel = "Fosfor (tonn)"
     elif base_path[-5] == "n":
@@ -125,21 +171,82 @@ def make_plot(df, title, base_path, year):
     else:
         raise ValueError("Could not identify ylabel.")
 
-    ax = df.set_index("År").plot(figsize=(8, 6), title=title, xlabel="", fontsize=12)
+    ax = _fig.add_subplot(111)
+    df.set_index("År").plot(ax=ax, title=title, xlabel="", fontsize=12)
     ax.legend(
         loc="center", bbox_to_anchor=(0.5, -0.2), ncol=3, prop={"size": 12}
     ).get_frame().set_boxstyle("Round", pad=0.2, rounding_size=0.5)
     ax.set_ylabel(ylabel, fontdict={"fontsize": 12, "fontweight": "bold"})
-    plt.tight_layout()
+
+    # Fixed margins leave room for the legend below the axes. This replaces
+    # tight_layout, which renders the whole figure an extra time per plot
+    _fig.subplots_adjust(left=0.12, right=0.97, top=0.93, bottom=0.26)
 
     fname = os.path.split(base_path)[1][:-4]
     png_path = f"../report_{year}/plots/{fname}_plot.png"
-    plt.savefig(png_path, dpi=200)
-    plt.close()
+    # The PNGs only ever get embedded in the Word document, so use a fast
+    # deflate level rather than spending CPU on maximum compression
+    _fig.savefig(png_path, dpi=200, pil_kwargs={"compress_level": 1})
+    _fig.clear()
 
     return png_path
 
 
+def make_plots(dfs, titles, base_paths, year):
+    """Create time series plots for several headings in parallel.
+
+    Rendering and PNG-encoding the plots is CPU-bound, so the work is spread
+    over a pool of worker processes (one per core).
+
+    Args:
+        dfs:        List of obj. Dataframes with table data
+        titles:     List of str. Titles for plots
+        base_paths: List of str. File paths for original CSV data tables
+        year:       Int. Report year
+
+    Returns:
+        List of plot paths. Plots are saved to ./plots/
+    """
+    with ProcessPoolExecutor() as ex:
+        png_paths = list(ex.map(make_plot, dfs, titles, base_paths, repeat(year)))
+
+    return png_paths
+
+
+def read_data_tables(fpaths, headings):
+    """Read several CSV data tables concurrently.
+
+    The reads are I/O-bound, so a thread pool is sufficient (pandas releases
+    the GIL while parsing).
+
+    Args:
+        fpaths:   List of str. Paths to CSV data
+        headings: List of str. Headings the tables belong to
+
+    Returns:
+        List of dataframes, in the same order as 'fpaths'.
+    """
+    with ThreadPoolExecutor() as ex:
+        dfs = list(ex.map(read_data_table, fpaths, headings))
+
+    return dfs
+
+
+@lru_cache(maxsize=None)
+def _read_1985_data(csv_path):
+    """Read the table of 1985 values extracted from John Rune's old report.
+    The same small CSV is needed for every heading, so the result is cached
+    after the first read.
+
+    Args:
+        csv_path: Path to CSV with 1985 data
+
+    Returns:
+        Dataframe, indexed by section name.
+    """
+    return pd.read_csv(csv_path, index_col="section_name")
+
+
 def read_data_table(fpath, heading):
     """Reads a CSV to a dataframe. Rounds values to integers and adds
     an extra row for 1985 at the start of each time series.
@@ -150,9 +257,9 @@ def read_data_table(fpath, heading):
     Returns:
         Dataframe
     """
-    # Read 1985 data
+    # Read 1985 data (cached after the first call)
     csv_path = r"../jse_data_1985/data_1985.csv"
-    df_85 = pd.read_csv(csv_path, index_col="section_name")
+    df_85 = _read_1985_data(csv_path)
 
     # Read model data
     df = pd.read_csv(fpath)
@@ -160,13 +267,13 @@ def read_data_table(fpath, heading):
     # Correct typo in Jose's column names
     df.rename({"Bakgrun": "Bakgrunn"}, axis="columns", inplace=True)
 
-    # Insert data from 1985 if relevant
+    # Insert data from 1985 if relevant. Assigning the extra row in-place
+    # avoids rebuilding the whole frame with pd.concat
     if heading in df_85.index:
-        row_85 = df_85.loc[[heading]]
-        df = pd.concat([row_85, df], axis="rows")
+        df.loc[len(df)] = df_85.loc[heading]
 
-    df.reset_index(inplace=True, drop=True)
     df.sort_values("År", inplace=True)
+    df.reset_index(inplace=True, drop=True)
     header = [
         "År",
         "Akvakultur",